@@ -0,0 +1,82 @@
+"""CUDA backend for MinionPool.
+
+The kernel runs on a fixed grid of BLOCKS blocks of THREADS_PER_BLOCK threads,
+each with its own random number generator state.  Threads step through the
+flattened (minion, subject) pairs with a grid-stride loop, so the same states
+are reused for every call whatever the size of the zoo.  This module is only
+imported by MinionPool.classify_all_cuda so that a CUDA device is not needed
+to use the rest of the package.
+"""
+
+import numpy as np
+from numba import cuda
+from numba.cuda.random import (create_xoroshiro128p_states,
+                               xoroshiro128p_uniform_float32)
+
+from _kernels import EXPERT, ALL_SINGLE, RANDOM, THRESHOLD_BITS
+
+THREADS_PER_BLOCK = 256
+BLOCKS = 1024
+
+@cuda.jit
+def _classify_all_kernel(kinds, labels, thr0, thr1, golds, states, out):
+  tid = cuda.grid(1)
+  n = golds.shape[0]
+  for i in range(tid, kinds.shape[0] * n, cuda.gridsize(1)):
+    m = i // n
+    s = i - m * n
+    kind = kinds[m]
+    if kind == EXPERT:
+      out[m, s] = golds[s]
+    elif kind == ALL_SINGLE:
+      out[m, s] = labels[m]
+    elif kind == RANDOM:
+      out[m, s] = 1 if xoroshiro128p_uniform_float32(states, tid) < 0.5 else 0
+    else:
+      thr = thr0[m] if golds[s] == 0 else thr1[m]
+      r = int(xoroshiro128p_uniform_float32(states, tid) \
+              * (1 << THRESHOLD_BITS))
+      out[m, s] = golds[s] if r < thr else 1 - golds[s]
+
+def to_device(kinds, labels, thr0, thr1, seed):
+  """Copy the arrays describing a MinionPool to the CUDA device and set up
+  the random number generator states of the kernel.
+
+  Parameters
+  ----------
+  kinds, labels, thr0, thr1 : ndarray, shape (n_minions,)
+    arrays describing the minions in the pool.
+  seed : int
+    seed for the device random number generators.
+
+  Returns
+  -------
+  arrays : tuple of DeviceNDArray
+    the given arrays on the device followed by the generator states.
+  """
+  states = create_xoroshiro128p_states(BLOCKS * THREADS_PER_BLOCK, seed=seed)
+  return tuple(cuda.to_device(a) for a in (kinds, labels, thr0, thr1)) \
+         + (states,)
+
+def classify_all(pool_arrays, golds):
+  """Classify the given subjects with every minion in a pool on the device.
+
+  Parameters
+  ----------
+  pool_arrays : tuple of DeviceNDArray
+    arrays describing the minions in the pool and the generator states, as
+    returned by to_device.
+  golds : ndarray, shape (n_subjects,)
+    expert provided gold labels.
+
+  Returns
+  -------
+  classifications : ndarray, shape (n_minions, n_subjects)
+    labels assigned to the given subjects by each minion.
+  """
+  kinds, labels, thr0, thr1, states = pool_arrays
+  out = cuda.device_array((kinds.shape[0], golds.shape[0]), dtype=np.int64)
+  _classify_all_kernel[BLOCKS, THREADS_PER_BLOCK](kinds, labels, thr0, thr1,
+                                                  cuda.to_device(golds),
+                                                  states, out)
+  return out.copy_to_host()
@@ -0,0 +1,131 @@
+"""Compiled batch classifiers for the minions.
+
+The signatures are given explicitly so the kernels are compiled when this
+module is imported rather than on first call.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+EXPERT = 0
+ALL_SINGLE = 1
+RANDOM = 2
+NOISY = 3
+
+# confusion matrix elements are quantized to THRESHOLD_BITS fixed point flip
+# thresholds, a label is kept when a uniform draw of that many bits is below
+# the threshold of its class.
+THRESHOLD_BITS = 16
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX0 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX1 = np.uint64(0x94D049BB133111EB)
+
+def quantize(p):
+  """Return the fixed point flip threshold for the probability p."""
+  return int(p * (1 << THRESHOLD_BITS))
+
+@njit(inline='always')
+def _noisy_label(gold, thr0, thr1):
+  """Flip the gold label unless a uniform draw is below the flip threshold of
+  its class.
+  """
+  thr = thr0 if gold == 0 else thr1
+  keep = np.random.randint(0, 1 << THRESHOLD_BITS) < thr
+  return gold if keep else 1 - gold
+
+@njit(inline='always')
+def _mix(z):
+  """Return the splitmix64 finalizer of the uint64 z."""
+  z = (z ^ (z >> np.uint64(30))) * _MIX0
+  z = (z ^ (z >> np.uint64(27))) * _MIX1
+  return z ^ (z >> np.uint64(31))
+
+@njit(inline='always')
+def _minion_key(seed, m):
+  """Return the splitmix64 stream start of minion m for the call seed.
+
+  _mix is a bijection, so every minion of a call gets a different stream.
+  """
+  return _mix(_mix(seed) ^ np.uint64(m))
+
+@njit(inline='always')
+def _draw(key, s):
+  """Return 64 random bits for subject s from the stream starting at key."""
+  return _mix(key + (np.uint64(s) + np.uint64(1)) * _GOLDEN)
+
+@njit(inline='always')
+def _minion_label(kind, label, thr0, thr1, gold, z):
+  """Return the label a minion of the given kind assigns to a subject using
+  the 64 random bits z.
+  """
+  if kind == EXPERT:
+    return gold
+  elif kind == ALL_SINGLE:
+    return np.int64(label)
+  elif kind == RANDOM:
+    return np.int64(z >> np.uint64(63))
+  thr = thr0 if gold == 0 else thr1
+  keep = (z >> np.uint64(64 - THRESHOLD_BITS)) < thr
+  return gold if keep else 1 - gold
+
+@njit('i8[:](i8[:], u4, u4)', cache=True)
+def noisy_classify(golds, thr0, thr1):
+  """Return the gold labels with noise added by a single NoisyMinion."""
+  out = np.empty(golds.shape[0], dtype=np.int64)
+  for i in range(golds.shape[0]):
+    out[i] = _noisy_label(golds[i], thr0, thr1)
+  return out
+
+@njit('void(i1[:], i1[:], u4[:], u4[:], u8, i8[:], i8[:, :])',
+      cache=True, parallel=True)
+def classify_all(kinds, labels, thr0, thr1, seed, golds, out):
+  """Classify every subject with every minion of a MinionPool.
+
+  Minions are classified in parallel.  Random numbers come from a splitmix64
+  stream per minion keyed on the call seed and the minion index, so the
+  result does not depend on how minions are scheduled across threads and the
+  numba generator state is left untouched.
+  """
+  for m in prange(kinds.shape[0]):
+    kind = kinds[m]
+    key = _minion_key(seed, m)
+    for s in range(golds.shape[0]):
+      out[m, s] = _minion_label(kind, labels[m], thr0[m], thr1[m], golds[s],
+                                _draw(key, s))
+
+def make_pipeline(aggregator):
+  """Build a kernel classifying subjects and aggregating their labels.
+
+  The returned kernel has the signature
+  ``(kinds, labels, thr0, thr1, seed, golds, initial, out)``.  For each
+  subject it folds the labels assigned by every minion into out[s] with
+  ``acc = aggregator(acc, label)`` starting from initial, so the labels are
+  never stored.  Random numbers are drawn as in classify_all.
+
+  Parameters
+  ----------
+  aggregator : numba.core.registry.CPUDispatcher
+    njit compiled function taking the accumulated value and a label and
+    returning the new accumulated value.
+
+  Returns
+  -------
+  pipeline : numba.core.registry.CPUDispatcher
+    fused classify and aggregate kernel.
+  """
+  @njit
+  def pipeline(kinds, labels, thr0, thr1, seed, golds, initial, out):
+    for s in range(golds.shape[0]):
+      acc = initial
+      for m in range(kinds.shape[0]):
+        z = _draw(_minion_key(seed, m), s)
+        acc = aggregator(acc, _minion_label(kinds[m], labels[m], thr0[m],
+                                            thr1[m], golds[s], z))
+      out[s] = acc
+  return pipeline
+
+@njit('void(i8)', cache=True)
+def seed(seed):
+  """Seed the random number generator used by the kernels."""
+  np.random.seed(seed)
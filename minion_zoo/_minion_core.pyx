@@ -0,0 +1,104 @@
+# cython: language_level=3
+"""Optional compiled classifiers for the minions.
+
+The extension can be built in place with::
+
+  cythonize -i _minion_core.pyx
+
+When it is available the minion module uses it for the classify method of
+NoisyMinion, otherwise the pure Python implementation is used.  Random numbers
+are drawn from a splitmix64 generator that is seeded through seed().
+"""
+
+from libc.stdint cimport uint32_t, uint64_t
+
+cdef uint64_t _state = 0x9E3779B97F4A7C15ULL
+
+cdef inline uint32_t _next32() nogil:
+  """Return the high 32 bits of the next splitmix64 output."""
+  global _state
+  cdef uint64_t z
+  _state += 0x9E3779B97F4A7C15ULL
+  z = _state
+  z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL
+  z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL
+  return <uint32_t>((z ^ (z >> 31)) >> 32)
+
+def seed(uint64_t seed):
+  """Seed the random number generator used by the compiled classifiers.
+
+  Parameters
+  ----------
+  seed : int
+    seed for the generator.
+  """
+  global _state
+  _state = seed
+
+cdef class NoisyCore:
+  """Compiled classify method of a NoisyMinion.
+
+  Parameters
+  ----------
+  thr0 : int
+    16 bit fixed point flip threshold of the 0 class.
+  thr1 : int
+    16 bit fixed point flip threshold of the 1 class.
+  """
+  cdef uint64_t thr[2]
+
+  def __cinit__(self, uint64_t thr0, uint64_t thr1):
+    self.thr[0] = thr0
+    self.thr[1] = thr1
+
+  cdef inline long _label(self, long gold_label) nogil:
+    return gold_label ^ ((_next32() >> 16) >= self.thr[gold_label])
+
+  cpdef long label(self, long gold_label) except? -1:
+    """Return the label assigned to a subject with the given gold label.
+
+    Parameters
+    ----------
+    gold_label : int
+      expert provided gold label.
+
+    Returns
+    -------
+    classification : int
+      label assigned to the subject.
+
+    Raises
+    ------
+    ValueError
+      if gold_label is not 0 or 1.
+    """
+    if gold_label != 0 and gold_label != 1:
+      raise ValueError('gold_label must be 0 or 1.')
+    return self._label(gold_label)
+
+  cpdef tuple classify(self, object subject_id, long gold_label):
+    """Classify the given subject with the gold label adding noise based on the
+    confusion matrix.
+
+    Parameters
+    ----------
+    subject_id : int
+      unique id of subject to classify.
+    gold_label : int
+      expert provided gold label.
+
+    Returns
+    -------
+    subject_id : int
+      unique id of classified subject.
+    classification : int
+      label assigned to the given subject.
+
+    Raises
+    ------
+    ValueError
+      if gold_label is not 0 or 1.
+    """
+    if gold_label != 0 and gold_label != 1:
+      raise ValueError('gold_label must be 0 or 1.')
+    return (subject_id, self._label(gold_label))
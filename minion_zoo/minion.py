@@ -4,8 +4,42 @@ This module defines a set of minion objects designed to mimic various
 classification behaviour.  All minions must implement the minion.classify()  method to determine how they assign classifications to subjects.
 """
 
+import operator
 import random
 
+import numpy as np
+
+import _kernels
+try:
+  import _minion_core
+except ImportError:
+  # the optional Cython extension has not been built.
+  _minion_core = None
+
+# single generator shared by the vectorized classifiers so that one seed
+# reproduces a whole zoo.  Scalar classify calls keep using the random module
+# as its per-call overhead is far lower than that of a numpy scalar draw.
+_rng = np.random.default_rng()
+_rng_integers = _rng.integers
+# bound once to skip the random module attribute lookup on every classify.
+_getrandbits = random.getrandbits
+_randrange = random.randrange
+
+def seed(seed):
+  """Seed the random number generators used by all minions.
+
+  Parameters
+  ----------
+  seed : int
+    seed for the random module, the shared numpy generator and the compiled
+    kernels.
+  """
+  random.seed(seed)
+  _rng.bit_generator.state = np.random.PCG64(seed).state
+  _kernels.seed(seed)
+  if _minion_core is not None:
+    _minion_core.seed(seed)
+
 class minion(object):
   """Abstract minion class.
 
@@ -20,7 +54,10 @@ class minion(object):
   -------
   classify(subject_id)
     classify the given subject.
+  classify_into(subject_id, out, idx)
+    classify the given subject writing the result to out.
   """
+  __slots__ = ('id', 'name')
   def __init__(self, id, name):
     """
     Parameters
@@ -50,7 +87,57 @@ class minion(object):
     """
     raise NotImplementedError
 
-class ExpertMinion(minion):
+  def classify_into(self, subject_id, out, idx):
+    """Abstract class method.
+
+    Must be overriden by subclasses.
+
+    Parameters
+    ----------
+    subject_id : int
+      unique id of subject to classify.
+    out : array-like, shape (2 * n_subjects,)
+      preallocated output holding subject ids interleaved with labels.
+    idx : int
+      index of this classification, the subject id is written to
+      out[2 * idx] and the label to out[2 * idx + 1].
+
+    Raises
+    ------
+    NotImplementedError
+      this class method must be overridden.
+    """
+    raise NotImplementedError
+
+class _SpecializedMinion(minion):
+  """Minion whose classify method is built at construction.
+
+  Subclasses pass a classify function specialized to their fixed state.  It
+  is stored on the instance and called directly, without creating a bound
+  method or looking up any minion attributes.  Each subclass declares the
+  classify slot itself, followed by an annotation carrying the docstring of
+  its classify method so that autodoc still documents it.
+  """
+  __slots__ = ()
+  def __init__(self, id, name, classify):
+    """
+    Parameters
+    ----------
+    id : int
+      unique minion id.
+    name : str
+      unique minion name.
+    classify : callable
+      classify function of this minion.
+    """
+    super().__init__(id, name)
+    self.classify = classify
+
+def _expert_classify(subject_id, gold_label):
+  """classify method of an ExpertMinion."""
+  return (subject_id, gold_label)
+
+class ExpertMinion(_SpecializedMinion):
   """Expert classifier always returns the correct label.
   
   Classifies a given subject with the expert provided label.
@@ -66,7 +153,33 @@ class ExpertMinion(minion):
   -------
   classify(subject_id, gold_label)
     classify the given subject with the provided gold label.
+  classify_into(subject_id, gold_label, out, idx)
+    classify the given subject with the provided gold label writing the
+    result to out.
   """
+  __slots__ = ('classify',)
+  classify: object
+  """Classify the given subject with the expert provided gold label.
+
+  Note
+  ----
+  The provided gold_label must be valid for the classification task.
+
+  Parameters
+  ----------
+  subject_id : int
+    unique id of subject to classify.
+  gold_label : int
+    expert provided gold label.
+
+  Returns
+  -------
+  subject_id : int
+    unique id of classified subject.
+  classification : int
+    label assigned to the given subject.
+  """
+
   def __init__(self, id, name):
     """
     Parameters
@@ -76,32 +189,43 @@ class ExpertMinion(minion):
     name : str
       unique minion name.
     """
-    super().__init__(id, name)
-  
-  def classify(self, subject_id, gold_label):
-    """Classify the given subject with the expert provided gold label.
-    
+    super().__init__(id, name, _expert_classify)
+
+  def classify_into(self, subject_id, gold_label, out, idx):
+    """Classify the given subject with the expert provided gold label writing
+    the result to out.
+
     Note
     ----
     The provided gold_label must be valid for the classification task.
-    
+
     Parameters
     ----------
     subject_id : int
       unique id of subject to classify.
     gold_label : int
       expert provided gold label.
-      
-    Returns
-    -------
-    subject_id : int
-      unique id of classified subject.
-    classification : int
-      label assigned to the given subject.
+    out : array-like, shape (2 * n_subjects,)
+      preallocated output holding subject ids interleaved with labels.
+    idx : int
+      index of this classification, the subject id is written to
+      out[2 * idx] and the label to out[2 * idx + 1].
     """
-    return (subject_id, gold_label)
+    out[2 * idx] = subject_id
+    out[2 * idx + 1] = gold_label
+
+def _make_single_label_classify(label):
+  """Build the classify method of an AllTheSingleLabelsMinion.
+
+  The label is captured by the returned closure so that classifying a subject
+  does not need to look up any minion attributes.
+  """
+  def classify(subject_id):
+    """classify method of an AllTheSingleLabelsMinion."""
+    return (subject_id, label)
+  return classify
 
-class AllTheSingleLabelsMinion(minion):
+class AllTheSingleLabelsMinion(_SpecializedMinion):
   """Classifier returning a single label only.
   
   Classifies all given subjects with the same label.
@@ -117,9 +241,29 @@ class AllTheSingleLabelsMinion(minion):
       
   Methods
   -------
-  classify(subject_id, gold_label)
-    classify the given subject with the provided gold label.
+  classify(subject_id)
+    classify the given subject with the label for this classifier.
+  classify_into(subject_id, out, idx)
+    classify the given subject with the label for this classifier writing
+    the result to out.
+  """
+  __slots__ = ('classify', 'label')
+  classify: object
+  """Classify the given subject with the label for this classifier.
+
+  Parameters
+  ----------
+  subject_id : int
+    unique id of subject to classify.
+
+  Returns
+  -------
+  subject_id : int
+    unique id of classified subject.
+  classification : int
+    label assigned to the given subject.
   """
+
   def __init__(self, id, name, label):
     """
     Parameters
@@ -135,25 +279,31 @@ class AllTheSingleLabelsMinion(minion):
     ----
     The provided labels must be valid for the classification task.
     """
-    super().__init__(id, name)
+    super().__init__(id, name, _make_single_label_classify(label))
     self.label = label
-  
-  def classify(self, subject_id):
-    """Classify the given subject with the label for this classifier.
-    
+
+  def __reduce__(self):
+    """Rebuild the minion from its constructor arguments when unpickled, as
+    the classify closure built at construction cannot be pickled.
+    """
+    return (type(self), (self.id, self.name, self.label))
+
+  def classify_into(self, subject_id, out, idx):
+    """Classify the given subject with the label for this classifier writing
+    the result to out.
+
     Parameters
     ----------
     subject_id : int
       unique id of subject to classify.
-      
-    Returns
-    -------
-    subject_id : int
-      unique id of classified subject.
-    classification : int
-      label assigned to the given subject.
+    out : array-like, shape (2 * n_subjects,)
+      preallocated output holding subject ids interleaved with labels.
+    idx : int
+      index of this classification, the subject id is written to
+      out[2 * idx] and the label to out[2 * idx + 1].
     """
-    return (subject_id, self.label)
+    out[2 * idx] = subject_id
+    out[2 * idx + 1] = self.label
 
 class RandomMinion(minion):
   """Classifier that returns a random label for a given subject.
@@ -167,14 +317,23 @@ class RandomMinion(minion):
     unique minion id.
   name : str
     unique minion name.
-  labels : array-like, shape (n_labels,)
-    list of valid labels for the classification task.
+  labels : tuple of int, shape (n_labels,)
+    valid labels for the classification task.
+  labels_arr : ndarray, shape (n_labels,)
+    valid labels for the classification task as an array.
       
   Methods
   -------
   classify(subject_id)
     classify the given subject with the provided gold label.
+  classify_into(subject_id, out, idx)
+    classify the given subject with a label selected randomly from the
+    provided labels writing the result to out.
+  classify_batch(subject_ids)
+    classify the given subjects with labels selected randomly from the
+    provided labels.
   """
+  __slots__ = ('labels', 'labels_arr', '_n', '_fast', '_l0', '_l1')
 
   def __init__(self, id, name, labels):
     """
@@ -186,13 +345,23 @@ class RandomMinion(minion):
       unique minion name.
     labels : array-like, shape (n_labels,)
       list of valid labels for the classification task.
+
+    Raises
+    ------
+    TypeError
+      if a label is not an integer.
       
     Note
     ----
     The provided labels must be valid for the classification task.
     """
     super().__init__(id, name)
-    self.labels = labels
+    self.labels = tuple(operator.index(x) for x in labels)
+    self._n = len(self.labels)
+    self._fast = self._n == 2
+    if self._fast:
+      self._l0, self._l1 = self.labels
+    self.labels_arr = np.asarray(self.labels)
   
   def classify(self, subject_id):
     """Classify the given subject with a label selected randomly from the 
@@ -210,9 +379,113 @@ class RandomMinion(minion):
     classification : int
       label assigned to the given subject.
     """
-    return (subject_id, random.choice(self.labels))
+    if self._fast:
+      return (subject_id, self._l1 if _getrandbits(1) else self._l0)
+    return (subject_id, self.labels[_randrange(self._n)])
+
+  def classify_into(self, subject_id, out, idx):
+    """Classify the given subject with a label selected randomly from the
+    provided labels writing the result to out.
+
+    Parameters
+    ----------
+    subject_id : int
+      unique id of subject to classify.
+    out : array-like, shape (2 * n_subjects,)
+      preallocated output holding subject ids interleaved with labels.
+    idx : int
+      index of this classification, the subject id is written to
+      out[2 * idx] and the label to out[2 * idx + 1].
+    """
+    out[2 * idx] = subject_id
+    if self._fast:
+      out[2 * idx + 1] = self._l1 if _getrandbits(1) else self._l0
+    else:
+      out[2 * idx + 1] = self.labels[_randrange(self._n)]
+
+  def classify_batch(self, subject_ids):
+    """Classify the given subjects with labels selected randomly from the
+    provided labels.
+
+    All labels are drawn in a single call to the shared random number
+    generator.
+
+    Parameters
+    ----------
+    subject_ids : array-like, shape (n_subjects,)
+      unique ids of subjects to classify.
+
+    Returns
+    -------
+    subject_ids : ndarray, shape (n_subjects,)
+      unique ids of classified subjects.
+    classifications : ndarray, shape (n_subjects,)
+      labels assigned to the given subjects.
+    """
+    sids = np.asarray(subject_ids)
+    return sids, self.labels_arr[_rng_integers(0, self._n, size=sids.shape[0])]
+
+def _make_noisy_classify(thr):
+  """Build the classify method of a NoisyMinion and a function returning
+  only the label, both drawing from the random module.
+
+  The fixed point flip thresholds are captured by the returned closures so
+  that classifying a subject does not need to look up any minion attributes.
+  """
+  getrandbits = _getrandbits
+  def classify(subject_id, gold_label):
+    """classify method of a NoisyMinion."""
+    if gold_label != 0 and gold_label != 1:
+      raise ValueError('gold_label must be 0 or 1.')
+    flip = getrandbits(_kernels.THRESHOLD_BITS) >= thr[gold_label]
+    return (subject_id, gold_label ^ flip)
+  def label(gold_label):
+    """Return the label assigned to a subject with the given gold label."""
+    if gold_label != 0 and gold_label != 1:
+      raise ValueError('gold_label must be 0 or 1.')
+    flip = getrandbits(_kernels.THRESHOLD_BITS) >= thr[gold_label]
+    return gold_label ^ flip
+  return classify, label
+
+def _make_buffered_noisy_classify(thr, n):
+  """Build the classify method of a NoisyMinion and a function returning
+  only the label, both drawing their random numbers from a shared
+  pre-allocated buffer.
+
+  n random numbers are drawn from the shared generator in a single call and
+  consumed one per classification.  The buffer is refilled with n new draws
+  once it is exhausted.
+  """
+  def fill():
+    high = 1 << _kernels.THRESHOLD_BITS
+    return iter(_rng_integers(0, high, size=n, dtype=np.uint32).tolist())
+  draws = fill()
+  def classify(subject_id, gold_label):
+    """classify method of a NoisyMinion."""
+    nonlocal draws
+    if gold_label != 0 and gold_label != 1:
+      raise ValueError('gold_label must be 0 or 1.')
+    try:
+      r = next(draws)
+    except StopIteration:
+      draws = fill()
+      r = next(draws)
+    flip = r >= thr[gold_label]
+    return (subject_id, gold_label ^ flip)
+  def label(gold_label):
+    """Return the label assigned to a subject with the given gold label."""
+    nonlocal draws
+    if gold_label != 0 and gold_label != 1:
+      raise ValueError('gold_label must be 0 or 1.')
+    try:
+      r = next(draws)
+    except StopIteration:
+      draws = fill()
+      r = next(draws)
+    return gold_label ^ (r >= thr[gold_label])
+  return classify, label
 
-class NoisyMinion(minion):
+class NoisyMinion(_SpecializedMinion):
   """Classifier returns the correct label a specified fraction of the time.
   
   The provided gold standard label is flipped based on the specified noise for
@@ -244,7 +517,44 @@ class NoisyMinion(minion):
   classify(subject_id, gold_label)
     classify the given subject with the gold label adding noise based on the 
     confusion matrix.
+  classify_into(subject_id, gold_label, out, idx)
+    classify the given subject with the gold label adding noise based on the
+    confusion matrix writing the result to out.
+  classify_batch(subject_ids, gold_labels)
+    classify the given subjects with the gold labels adding noise based on
+    the confusion matrix.
+  prealloc(n)
+    draw the random numbers for the next n classifications at once.
+  """
+  __slots__ = ('classify', 'confusion_matrix', '_thr', '_label')
+  classify: object
+  """Classify the given subject with the gold label adding noise based on the
+  confusion matrix.
+
+  Note
+  ----
+  The provided gold_label must be valid for the classification task.
+
+  Parameters
+  ----------
+  subject_id : int
+    unique id of subject to classify.
+  gold_label : int
+    expert provided gold label.
+
+  Returns
+  -------
+  subject_id : int
+    unique id of classified subject.
+  classification : int
+    label assigned to the given subject.
+
+  Raises
+  ------
+  ValueError
+    if gold_label is not 0 or 1.
   """
+
   def __init__(self, id, name, confusion_matrix):
     """
     Parameters
@@ -260,41 +570,311 @@ class NoisyMinion(minion):
     Raises
     ------
     ValueError
-      if all confusion matrix elements are not in the interval [0,1].
+      if any confusion matrix element is not in the interval [0,1].
       
     Note
     ----
     The confusion matrix elements must be in the interval [0,1]
     """
-    super().__init__(id, name)
-    if (confusion_matrix < 0).any() and (confusion_matrix > 1).any():
-      raise ValueError('All confusion matrix elements must be in the' \
+    cm = np.asarray(confusion_matrix, dtype=np.float64)
+    if cm.min() < 0.0 or cm.max() > 1.0:
+      raise ValueError('All confusion matrix elements must be in the ' \
                     +  'interval [0,1].')
-    self.confusion_matrix = confusion_matrix
+    thr = (_kernels.quantize(cm[0]), _kernels.quantize(cm[1]))
+    if _minion_core is not None:
+      core = _minion_core.NoisyCore(*thr)
+      classify, label = core.classify, core.label
+    else:
+      classify, label = _make_noisy_classify(thr)
+    super().__init__(id, name, classify)
+    self._label = label
+    self.confusion_matrix = cm
+    self._thr = thr
+
+  def __reduce__(self):
+    """Rebuild the minion from its constructor arguments when unpickled, as
+    the classify closure built at construction cannot be pickled.
+    """
+    return (type(self), (self.id, self.name, self.confusion_matrix))
+
+  def classify_batch(self, subject_ids, gold_labels):
+    """Classify the given subjects with the gold labels adding noise based on
+    the confusion matrix.
+
+    Note
+    ----
+    The provided gold_labels must be valid for the classification task.
+
+    Parameters
+    ----------
+    subject_ids : array-like, shape (n_subjects,)
+      unique ids of subjects to classify.
+    gold_labels : array-like, shape (n_subjects,)
+      expert provided gold labels.
 
-  def classify(self, subject_id, gold_label):
+    Returns
+    -------
+    subject_ids : ndarray, shape (n_subjects,)
+      unique ids of classified subjects.
+    classifications : ndarray, shape (n_subjects,)
+      labels assigned to the given subjects.
+    """
+    sids = np.asarray(subject_ids)
+    golds = np.asarray(gold_labels, dtype=np.int64)
+    return sids, _kernels.noisy_classify(golds, *self._thr)
+
+  def classify_into(self, subject_id, gold_label, out, idx):
     """Classify the given subject with the gold label adding noise based on the
-    confusion matrix.
+    confusion matrix writing the result to out.
+
+    The label is drawn from the same random number source as classify,
+    including a prealloc buffer or the compiled core.
 
     Note
     ----
     The provided gold_label must be valid for the classification task.
-    
+
     Parameters
     ----------
     subject_id : int
       unique id of subject to classify.
     gold_label : int
       expert provided gold label.
-      
+    out : array-like, shape (2 * n_subjects,)
+      preallocated output holding subject ids interleaved with labels.
+    idx : int
+      index of this classification, the subject id is written to
+      out[2 * idx] and the label to out[2 * idx + 1].
+
+    Raises
+    ------
+    ValueError
+      if gold_label is not 0 or 1.
+    """
+    out[2 * idx] = subject_id
+    out[2 * idx + 1] = self._label(gold_label)
+
+  def prealloc(self, n):
+    """Draw the random numbers for the next n classifications at once.
+
+    Replaces classify with a method consuming a buffer of n pre-drawn random
+    numbers, which is refilled with n new draws once it is exhausted.  Use
+    this when the number of classifications in an epoch is known ahead.
+
+    Parameters
+    ----------
+    n : int
+      number of random numbers to draw into the buffer.
+
+    Raises
+    ------
+    ValueError
+      if n is less than 1.
+    """
+    if n < 1:
+      raise ValueError('The buffer must hold at least 1 random number.')
+    self.classify, self._label = _make_buffered_noisy_classify(self._thr, n)
+
+class MinionPool(object):
+  """Collection of minions stored as parallel arrays.
+
+  Classifies subjects for every minion in the pool at once.  Each minion is
+  reduced to a kind tag and the parameters needed to reproduce its
+  classification behaviour, so a whole zoo can be classified without calling
+  the classify method of each minion.
+
+  Note
+  ----
+  The MinionPool class is currently only implemented for binary
+  classification problems.
+
+  Attributes
+  ----------
+  ids : ndarray, shape (n_minions,)
+    unique minion ids.
+  kinds : ndarray, shape (n_minions,)
+    kind tag of each minion, one of EXPERT, ALL_SINGLE, RANDOM or NOISY.
+  labels : ndarray, shape (n_minions,)
+    label returned by each AllTheSingleLabelsMinion, 0 for other kinds.
+  thr0 : ndarray, shape (n_minions,)
+    0 class confusion matrix element of each NoisyMinion quantized to a fixed
+    point flip threshold, the threshold of an element of 1 for other kinds.
+  thr1 : ndarray, shape (n_minions,)
+    1 class confusion matrix element of each NoisyMinion quantized to a fixed
+    point flip threshold, the threshold of an element of 1 for other kinds.
+
+  Methods
+  -------
+  classify_all(subject_ids, gold_labels)
+    classify the given subjects with every minion in the pool.
+  classify_all_cuda(subject_ids, gold_labels)
+    classify the given subjects with every minion in the pool on a CUDA
+    device.
+  compile_pipeline(aggregator, initial=0, dtype=numpy.int64)
+    build a function classifying subjects with every minion in the pool and
+    aggregating their labels in one pass.
+  """
+  EXPERT = _kernels.EXPERT
+  ALL_SINGLE = _kernels.ALL_SINGLE
+  RANDOM = _kernels.RANDOM
+  NOISY = _kernels.NOISY
+
+  def __init__(self, minions):
+    """
+    Parameters
+    ----------
+    minions : sequence of minion
+      minions to add to the pool.
+
+    Raises
+    ------
+    TypeError
+      if a minion is not one of the supported minion classes.
+    ValueError
+      if a RandomMinion has labels other than 0 and 1 or an
+      AllTheSingleLabelsMinion has a label other than 0 or 1.
+    """
+    n = len(minions)
+    self.ids = np.empty(n, dtype=np.int64)
+    self.kinds = np.empty(n, dtype=np.int8)
+    self.labels = np.zeros(n, dtype=np.int8)
+    self.thr0 = np.full(n, _kernels.quantize(1), dtype=np.uint32)
+    self.thr1 = np.full(n, _kernels.quantize(1), dtype=np.uint32)
+    for i, m in enumerate(minions):
+      self.ids[i] = m.id
+      if isinstance(m, ExpertMinion):
+        self.kinds[i] = self.EXPERT
+      elif isinstance(m, AllTheSingleLabelsMinion):
+        if m.label not in (0, 1):
+          raise ValueError('AllTheSingleLabelsMinion label must be 0 or 1.')
+        self.kinds[i] = self.ALL_SINGLE
+        self.labels[i] = m.label
+      elif isinstance(m, RandomMinion):
+        if sorted(m.labels) != [0, 1]:
+          raise ValueError('RandomMinion labels must be 0 and 1.')
+        self.kinds[i] = self.RANDOM
+      elif isinstance(m, NoisyMinion):
+        self.kinds[i] = self.NOISY
+        self.thr0[i], self.thr1[i] = m._thr
+      else:
+        raise TypeError('Unsupported minion type %s.' % type(m).__name__)
+    self._device = None
+
+  def classify_all(self, subject_ids, gold_labels):
+    """Classify the given subjects with every minion in the pool.
+
+    Minions are classified in parallel on the numba thread pool.
+
+    Note
+    ----
+    The provided gold_labels must be valid for the classification task.
+
+    Parameters
+    ----------
+    subject_ids : array-like, shape (n_subjects,)
+      unique ids of subjects to classify.
+    gold_labels : array-like, shape (n_subjects,)
+      expert provided gold labels.
+
     Returns
     -------
-    subject_id : int
-      unique id of classified subject.
-    classification : int
-      label assigned to the given subject.
+    subject_ids : ndarray, shape (n_subjects,)
+      unique ids of classified subjects.
+    classifications : ndarray, shape (n_minions, n_subjects)
+      labels assigned to the given subjects by each minion.
     """
-    if random.random() < self.confusion_matrix[gold_label]:
-      return (subject_id, gold_label)
-    else:
-      return (subject_id, gold_label == 0)
+    sids = np.asarray(subject_ids)
+    golds = np.asarray(gold_labels, dtype=np.int64)
+    out = np.empty((self.kinds.shape[0], golds.shape[0]), dtype=np.int64)
+    seed = _rng_integers(0, 1 << 64, dtype=np.uint64)
+    _kernels.classify_all(self.kinds, self.labels, self.thr0, self.thr1,
+                          seed, golds, out)
+    return sids, out
+
+  def compile_pipeline(self, aggregator, initial=0, dtype=np.int64):
+    """Build a function classifying subjects with every minion in the pool and
+    aggregating their labels in one pass.
+
+    The classification and aggregation are fused into a single compiled loop
+    so the labels assigned by each minion are never stored.  For example, the
+    number of votes for the 1 class can be counted with::
+
+      @numba.njit
+      def vote(acc, label):
+        return acc + label
+
+      pipeline = pool.compile_pipeline(vote)
+      subject_ids, votes = pipeline(subject_ids, gold_labels)
+
+    Note
+    ----
+    The pipeline is compiled on its first call and captures the minions in
+    the pool when compile_pipeline is called.
+
+    Parameters
+    ----------
+    aggregator : callable
+      numba.njit compiled function taking the accumulated value and the label
+      assigned to a subject by a minion, and returning the new accumulated
+      value.
+    initial : scalar, optional
+      initial accumulated value for each subject.
+    dtype : dtype, optional
+      type of the aggregated values.
+
+    Returns
+    -------
+    pipeline : callable
+      function taking subject_ids and gold_labels array-likes of shape
+      (n_subjects,) and returning the subject ids and the aggregated values,
+      both ndarrays of shape (n_subjects,).
+    """
+    kernel = _kernels.make_pipeline(aggregator)
+    kinds, labels, thr0, thr1 = self.kinds, self.labels, self.thr0, self.thr1
+    initial = np.dtype(dtype).type(initial)
+    def pipeline(subject_ids, gold_labels):
+      sids = np.asarray(subject_ids)
+      golds = np.asarray(gold_labels, dtype=np.int64)
+      out = np.empty(golds.shape[0], dtype=dtype)
+      seed = _rng_integers(0, 1 << 64, dtype=np.uint64)
+      kernel(kinds, labels, thr0, thr1, seed, golds, initial, out)
+      return sids, out
+    return pipeline
+
+  def classify_all_cuda(self, subject_ids, gold_labels):
+    """Classify the given subjects with every minion in the pool on a CUDA
+    device.
+
+    The pool is copied to the device and the device random number
+    generators are seeded from the shared generator on the first call, both
+    are kept on the device for later calls.  Each call still copies the gold
+    labels to the device and the (n_minions, n_subjects) classifications
+    back, which can outweigh the kernel itself, so benchmark against
+    classify_all before relying on this method for speed.
+
+    Note
+    ----
+    The provided gold_labels must be valid for the classification task.
+
+    Parameters
+    ----------
+    subject_ids : array-like, shape (n_subjects,)
+      unique ids of subjects to classify.
+    gold_labels : array-like, shape (n_subjects,)
+      expert provided gold labels.
+
+    Returns
+    -------
+    subject_ids : ndarray, shape (n_subjects,)
+      unique ids of classified subjects.
+    classifications : ndarray, shape (n_minions, n_subjects)
+      labels assigned to the given subjects by each minion.
+    """
+    import _cuda
+    if self._device is None:
+      self._device = _cuda.to_device(self.kinds, self.labels,
+                                     self.thr0, self.thr1,
+                                     int(_rng_integers(0, 1 << 63)))
+    sids = np.asarray(subject_ids)
+    golds = np.asarray(gold_labels, dtype=np.int64)
+    return sids, _cuda.classify_all(self._device, golds)
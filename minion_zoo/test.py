@@ -1,6 +1,13 @@
+import array
+import pickle
+
+import numpy as np
+from numba import njit
+
 from config import Config
-from minion import (minion, ExpertMinion,
-                    AllTheSingleLabelsMinion, RandomMinion)
+from minion import (seed, minion, ExpertMinion,
+                    AllTheSingleLabelsMinion, RandomMinion, NoisyMinion,
+                    MinionPool)
 
 def main():
   config = Config()
@@ -12,21 +19,101 @@ def main():
 
   m = ExpertMinion(1, names[1])
   assert m.classify(1, 0)[1] == 0
+  out = array.array('q', [0] * 4)
+  m.classify_into(7, 1, out, 1)
+  assert list(out) == [0, 0, 7, 1]
 
   m = AllTheSingleLabelsMinion(2, names[2], 0)
   assert m.classify(1)[1] == 0
 
   m = AllTheSingleLabelsMinion(3, names[3], 1)
   assert m.classify(1)[1] == 1
+  assert pickle.loads(pickle.dumps(m)).classify(1)[1] == 1
+  m.classify_into(7, out, 0)
+  assert list(out) == [7, 1, 7, 1]
 
   m = RandomMinion(4, names[4], config.labels)
-  # this will fail 1 in 2^100 times
-  x = []
-  for i in range(100):
-    x.append(m.classify(1)[1])
-  x = set(x)
+  # these will fail 1 in 2^100 times
+  cls = m.classify
+  x = set([cls(1)[1] for _ in range(100)])
   assert 0 in x
   assert 1 in x
+  sids, x = m.classify_batch(np.ones(100, dtype=np.int64))
+  assert x.shape == sids.shape
+  labels_seen = np.unique(x)
+  assert 0 in labels_seen
+  assert 1 in labels_seen
+
+  assert RandomMinion(4, names[4], np.array([0, 1])).labels == (0, 1)
+  try:
+    RandomMinion(4, names[4], [0.0, 0.5, 1.0])
+    assert False
+  except TypeError:
+    pass
+
+  golds = np.array([0, 1, 1, 0])
+  m = NoisyMinion(5, names[5], np.array([1., 1.]))
+  assert m.classify(1, 0)[1] == 0
+  assert (m.classify_batch(np.arange(4), golds)[1] == golds).all()
+
+  m = NoisyMinion(6, names[6], np.array([0., 0.]))
+  assert m.classify(1, 0)[1] == 1
+  assert pickle.loads(pickle.dumps(m)).classify(1, 0)[1] == 1
+  m.classify_into(7, 1, out, 1)
+  assert out[3] == 0
+  assert (m.classify_batch(np.arange(4), golds)[1] == 1 - golds).all()
+  try:
+    m.prealloc(0)
+    assert False
+  except ValueError:
+    pass
+  m.prealloc(2)
+  assert [m.classify(1, g)[1] for g in golds] == list(1 - golds)
+
+  for m in (NoisyMinion(7, names[7], [0.5, 0.5]), m):
+    for gold_label in (-1, 2):
+      for classify in (lambda: m.classify(1, gold_label),
+                       lambda: m.classify_into(1, gold_label, out, 0)):
+        try:
+          classify()
+          assert False
+        except ValueError:
+          pass
+
+  for cm in ([-0.1, 0.5], [0.5, 1.1]):
+    try:
+      NoisyMinion(7, names[7], cm)
+      assert False
+    except ValueError:
+      pass
+
+  pool = MinionPool([ExpertMinion(1, names[1]),
+                     AllTheSingleLabelsMinion(2, names[2], 1),
+                     RandomMinion(4, names[4], config.labels),
+                     NoisyMinion(6, names[6], np.array([0., 0.]))])
+  sids, x = pool.classify_all(np.arange(4), golds)
+  assert x.shape == (4, 4)
+  assert (x[0] == golds).all()
+  assert (x[1] == 1).all()
+  assert set(x[2]) <= set(config.labels)
+  assert (x[3] == 1 - golds).all()
+
+  for label in (-1, 2, 300):
+    try:
+      MinionPool([AllTheSingleLabelsMinion(2, names[2], label)])
+      assert False
+    except ValueError:
+      pass
+
+  vote = njit(lambda acc, label: acc + label)
+  sids, votes = pool.compile_pipeline(vote)(np.arange(4), golds)
+  # expert, single label and obtuse minions always cast 2 votes between them
+  assert set(votes) <= {2, 3}
+
+  seed(42)
+  x = pool.classify_all(np.arange(4), golds)[1]
+  seed(42)
+  assert (pool.classify_all(np.arange(4), golds)[1] == x).all()
 
 if __name__ == '__main__':
   main()